@@ -5,9 +5,9 @@ import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from .config import DEFAULT_EARTH_SIZE, DEFAULT_GAMMA, DEFAULT_PADDING_RATIO, DEFAULT_SATELLITE, SATELLITES
+from .config import CACHE_DIR, DEFAULT_EARTH_SIZE, DEFAULT_GAMMA, DEFAULT_PADDING_RATIO, DEFAULT_SATELLITE, SATELLITES
 from .fetcher import fetch_rgb_bands
-from .processor import render_image
+from .processor import render_image, save_image
 
 
 def parse_time(time_str: str) -> datetime:
@@ -85,7 +85,7 @@ Examples:
         "-o", "--output",
         type=Path,
         required=True,
-        help="Output image path (PNG recommended)",
+        help="Output image path (.png, .jpg, .tif or .bmp; PNG recommended)",
     )
     
     parser.add_argument(
@@ -124,6 +124,12 @@ Examples:
         help=f"Gamma correction (default: {DEFAULT_GAMMA})",
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always download band files instead of using the local cache ({CACHE_DIR})",
+    )
+    
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -158,6 +164,7 @@ Examples:
             earth_size=args.earth_size,
             satellite=args.satellite,
             verbose=verbose,
+            cache_dir=None if args.no_cache else CACHE_DIR,
         )
         
         if verbose:
@@ -172,7 +179,7 @@ Examples:
         
         # Save
         args.output.parent.mkdir(parents=True, exist_ok=True)
-        image.save(args.output)
+        save_image(image, args.output)
         
         if not args.quiet:
             print(f"Saved: {args.output} ({image.size[0]}x{image.size[1]})")
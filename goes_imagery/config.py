@@ -1,6 +1,8 @@
 """Configuration and constants for GOES imagery processing."""
 
+import os
 from dataclasses import dataclass
+from pathlib import Path
 
 
 @dataclass
@@ -71,3 +73,7 @@ GREEN_COEFFICIENTS = (0.45, 0.10, 0.45)  # (red, veggie, blue)
 DEFAULT_EARTH_SIZE = 2048  # Pixels for Earth diameter
 DEFAULT_PADDING_RATIO = 2.1  # Final image size = earth_size * padding_ratio
 DEFAULT_GAMMA = 2.2  # Gamma correction for better visualization
+
+# Local cache for downloaded NetCDF files, evicted least-recently-used past the size cap
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "goes-imagery"
+CACHE_MAX_BYTES = 1024**3  # 1 GB
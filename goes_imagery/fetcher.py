@@ -1,22 +1,116 @@
 """Fetch GOES data from AWS S3."""
 
+import functools
+import io
+import math
+import os
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import boto3
 import netCDF4 as nc
 import numpy as np
+from boto3.s3.transfer import TransferConfig
 from botocore import UNSIGNED
 from botocore.config import Config
 from PIL import Image
 
-from .config import DEFAULT_SATELLITE, PRODUCT, RGB_BANDS, SATELLITES
+try:
+    import cv2
+except ImportError:  # optional: pip install goes-imagery[fast]
+    cv2 = None
 
+try:
+    import h5py
+except ImportError:  # optional: pip install goes-imagery[fast]
+    h5py = None
 
+try:
+    from numba import njit, prange
+except ImportError:  # optional: pip install goes-imagery[fast]
+    njit = None
+
+from .config import (
+    CACHE_DIR,
+    CACHE_MAX_BYTES,
+    DEFAULT_SATELLITE,
+    PRODUCT,
+    RGB_BANDS,
+    SATELLITES,
+)
+
+# Serializes netCDF4 decoding across the band download threads
+_netcdf_lock = threading.Lock()
+
+# Serializes parallel Numba launches across the band download threads; the
+# workqueue threading layer (used without TBB/OpenMP) aborts on concurrent use
+_numba_lock = threading.Lock()
+
+# Split large objects into 8 MB ranged GETs fetched concurrently
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+
+@functools.lru_cache(maxsize=1)
 def get_s3_client():
-    """Create anonymous S3 client for public NOAA bucket."""
-    return boto3.client("s3", config=Config(signature_version=UNSIGNED))
+    """
+    Create anonymous S3 client for public NOAA bucket.
+    
+    The client is cached so repeated calls share one connection pool. The pool is
+    sized for three concurrent band downloads of 8 ranged GETs each.
+    """
+    return boto3.client(
+        "s3",
+        config=Config(
+            signature_version=UNSIGNED,
+            max_pool_connections=32,
+            tcp_keepalive=True,
+            retries={"max_attempts": 5, "mode": "adaptive"},
+        ),
+    )
+
+
+def _find_band_file(
+    s3_client,
+    bucket: str,
+    target_time: datetime,
+    band: int,
+) -> tuple[str, str] | None:
+    """
+    Find the most recent file for a single band, searching back up to 6 hours.
+    
+    Returns:
+        (bucket, key) tuple, or None if no file was found.
+    """
+    for hours_back in range(6):
+        check_time = target_time - timedelta(hours=hours_back)
+        day_of_year = check_time.timetuple().tm_yday
+        # Include the band in the prefix so S3 only returns this band's files
+        prefix = (
+            f"{PRODUCT}/{check_time.year}/{day_of_year:03d}/{check_time.hour:02d}/"
+            f"OR_{PRODUCT}-M6C{band:02d}"
+        )
+        
+        try:
+            response = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix)
+        except Exception:
+            continue
+        
+        band_files = response.get("Contents", [])
+        if band_files:
+            # Filenames embed the scan start time (_sYYYYJJJHHMMSS), so the
+            # lexically greatest key is the most recent scan
+            latest = max(band_files, key=lambda x: x["Key"])
+            return bucket, latest["Key"]
+    
+    return None
 
 
 def find_band_files(
@@ -45,38 +139,221 @@ def find_band_files(
     elif target_time.tzinfo is None:
         target_time = target_time.replace(tzinfo=timezone.utc)
     
-    files = {}
-    for band in bands:
-        # Search current hour and previous hours
-        for hours_back in range(6):
-            check_time = target_time - timedelta(hours=hours_back)
-            day_of_year = check_time.timetuple().tm_yday
-            prefix = f"{PRODUCT}/{check_time.year}/{day_of_year:03d}/{check_time.hour:02d}/"
-            
-            try:
-                response = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix)
-                if "Contents" not in response:
-                    continue
-                
-                # Filter for specific band
-                band_str = f"M6C{band:02d}"
-                band_files = [
-                    obj for obj in response["Contents"]
-                    if band_str in obj["Key"] and obj["Key"].endswith(".nc")
-                ]
-                
-                if band_files:
-                    # Get the most recent one
-                    latest = max(band_files, key=lambda x: x["LastModified"])
-                    files[band] = (bucket, latest["Key"])
-                    break
-            except Exception:
-                continue
+    # Search all bands concurrently; each search stops at its first hit
+    with ThreadPoolExecutor(max_workers=len(bands) or 1) as executor:
+        results = executor.map(
+            lambda band: _find_band_file(s3_client, bucket, target_time, band),
+            bands,
+        )
+        files = {band: found for band, found in zip(bands, results) if found is not None}
     
     return files
 
 
-def download_band(s3_client, bucket: str, key: str, target_size: int) -> np.ndarray:
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _block_mean_kernel(data, k, out):
+        """NaN-aware k x k block mean, one output row per parallel iteration."""
+        for i in prange(out.shape[0]):
+            for j in range(out.shape[1]):
+                total = 0.0
+                count = 0
+                for di in range(k):
+                    for dj in range(k):
+                        v = data[i * k + di, j * k + dj]
+                        if not math.isnan(v):
+                            total += v
+                            count += 1
+                out[i, j] = total / count if count else np.nan
+else:
+    _block_mean_kernel = None
+
+
+def _block_mean(data: np.ndarray, k: int) -> np.ndarray:
+    """Downsample by an integer factor k, averaging the non-NaN pixels of each k x k block."""
+    h, w = data.shape
+    
+    if _block_mean_kernel is not None:
+        out = np.empty((h // k, w // k), dtype=np.float32)
+        with _numba_lock:
+            _block_mean_kernel(data, k, out)
+        return out
+    
+    valid = ~np.isnan(data)
+    blocks = np.where(valid, data, 0).reshape(h // k, k, w // k, k)
+    sums = blocks.sum(axis=(1, 3), dtype=np.float32)
+    counts = valid.reshape(h // k, k, w // k, k).sum(axis=(1, 3))
+    
+    # Blocks that are entirely space divide 0 by 0 and stay NaN
+    with np.errstate(invalid="ignore"):
+        return sums / counts.astype(np.float32)
+
+
+def _resize(data: np.ndarray, target_size: int) -> np.ndarray:
+    """
+    Resize a square float32 band to target_size x target_size.
+    
+    Integer downsampling ratios use a NaN-aware block mean. Other ratios use
+    OpenCV's area interpolation when available (SIMD, multi-threaded), falling
+    back to PIL's Lanczos filter otherwise.
+    """
+    size = data.shape[0]
+    if size > target_size and size % target_size == 0:
+        return _block_mean(data, size // target_size)
+    
+    if cv2 is not None:
+        return cv2.resize(data, (target_size, target_size), interpolation=cv2.INTER_AREA)
+    
+    img = Image.fromarray(data)
+    img = img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+    return np.array(img)
+
+
+def _evict_cache(cache_dir: Path, max_bytes: int = CACHE_MAX_BYTES) -> None:
+    """Delete least-recently-used cached files until the cache fits in max_bytes."""
+    entries = []
+    for path in cache_dir.glob("*.nc"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def _store_cached(cache_dir: Path, cache_path: Path, body: bytes) -> None:
+    """Write a downloaded object into the cache, ignoring local I/O failures."""
+    tmp_path = None
+    try:
+        # Write to a temp file and rename so concurrent readers never see partial data
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".part", delete=False) as tmp:
+            tmp_path = Path(tmp.name)
+            tmp.write(body)
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+        _evict_cache(cache_dir)
+    except OSError:
+        pass
+    finally:
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+def _download_bytes(s3_client, bucket: str, key: str) -> bytes:
+    """Download an S3 object into memory using parallel byte-range requests."""
+    buffer = io.BytesIO()
+    s3_client.download_fileobj(bucket, key, buffer, Config=_TRANSFER_CONFIG)
+    return buffer.getvalue()
+
+
+def _fetch_object(s3_client, bucket: str, key: str, cache_dir: Path | None) -> bytes:
+    """
+    Read an S3 object into memory, going through the local cache if enabled.
+    
+    S3 keys are immutable for GOES products, so a cached copy never goes stale.
+    """
+    if cache_dir is None:
+        return _download_bytes(s3_client, bucket, key)
+    
+    # The cache is best-effort: any local I/O failure falls back to downloading
+    cache_path = cache_dir / key.replace("/", "_")
+    try:
+        body = cache_path.read_bytes()
+    except OSError:
+        pass
+    else:
+        try:
+            os.utime(cache_path)  # mark as recently used for eviction
+        except OSError:
+            pass
+        return body
+    
+    body = _download_bytes(s3_client, bucket, key)
+    _store_cached(cache_dir, cache_path, body)
+    
+    return body
+
+
+def _read_step(size: int, target_size: int) -> int:
+    """
+    Stride for reading a band of the given size destined for target_size.
+    
+    Skips rows/columns we would discard when resizing, while keeping at least
+    2x the target resolution for the resampling filter.
+    """
+    return max(1, size // (target_size * 2))
+
+
+def _read_cmi_netcdf(body: bytes, target_size: int) -> np.ndarray:
+    """Read the CMI variable with netCDF4, returning float32 with NaN for invalid pixels."""
+    # Bands download in parallel, but libnetcdf/HDF5 are not thread-safe and
+    # netCDF4 releases the GIL around them, so decoding must be serialized
+    with _netcdf_lock, nc.Dataset("goes.nc", mode="r", memory=body) as dataset:
+        # Get CMI (Cloud and Moisture Imagery) variable
+        cmi_var = dataset.variables["CMI"]
+        step = _read_step(cmi_var.shape[0], target_size)
+        data = cmi_var[::step, ::step]
+        fill_value = getattr(cmi_var, "_FillValue", -1)
+    
+    # Convert to float and mark invalid pixels (space) as NaN
+    if np.ma.is_masked(data):
+        data = np.ma.filled(data.astype(np.float32, copy=False), np.nan)
+    else:
+        data = np.ma.getdata(data).astype(np.float32, copy=False)
+        np.putmask(data, (data == fill_value) | (data < 0), np.nan)
+    
+    return data
+
+
+def _read_cmi_h5py(body: bytes, target_size: int) -> np.ndarray:
+    """
+    Read the CMI variable with h5py, returning float32 with NaN for invalid pixels.
+    
+    The packed values are read straight into a preallocated float32 buffer, which
+    bypasses netCDF4's MaskedArray construction. Fill, valid range and scaling
+    are then applied in place, matching netCDF4's default decoding.
+    """
+    with h5py.File(io.BytesIO(body), "r") as f:
+        cmi_var = f["CMI"]
+        step = _read_step(cmi_var.shape[0], target_size)
+        shape = tuple(len(range(0, n, step)) for n in cmi_var.shape)
+        data = np.empty(shape, dtype=np.float32)
+        cmi_var.read_direct(data, source_sel=np.s_[::step, ::step])
+        attrs = cmi_var.attrs
+        fill_value = attrs.get("_FillValue", [-1])[0]
+        valid_range = attrs.get("valid_range")
+        scale_factor = attrs.get("scale_factor", [1.0])[0]
+        add_offset = attrs.get("add_offset", [0.0])[0]
+    
+    invalid = data == fill_value
+    if valid_range is not None:
+        invalid |= (data < valid_range[0]) | (data > valid_range[1])
+    
+    data *= np.float32(scale_factor)
+    data += np.float32(add_offset)
+    invalid |= data < 0
+    np.putmask(data, invalid, np.nan)
+    
+    return data
+
+
+def download_band(
+    s3_client,
+    bucket: str,
+    key: str,
+    target_size: int,
+    cache_dir: Path | None = CACHE_DIR,
+) -> np.ndarray:
     """
     Download a band file and extract/resize the data.
     
@@ -85,43 +362,24 @@ def download_band(s3_client, bucket: str, key: str, target_size: int) -> np.ndar
         bucket: S3 bucket name
         key: S3 object key
         target_size: Target size to resize to (pixels)
+        cache_dir: Directory for cached NetCDF files. None = always download.
     
     Returns:
         2D numpy array of reflectance values, NaN for invalid/space pixels.
     """
-    with tempfile.NamedTemporaryFile(suffix=".nc", delete=False) as tmp:
-        s3_client.download_fileobj(bucket, key, tmp)
-        tmp_path = Path(tmp.name)
+    # Read the object straight into memory and decode it from the buffer,
+    # which avoids writing the file to disk only to read it back
+    body = _fetch_object(s3_client, bucket, key, cache_dir)
     
-    try:
-        dataset = nc.Dataset(tmp_path, "r")
-        
-        # Get CMI (Cloud and Moisture Imagery) variable
-        cmi_var = dataset.variables["CMI"]
-        data = cmi_var[:]
-        fill_value = getattr(cmi_var, "_FillValue", -1)
-        dataset.close()
-        
-        # Create mask for invalid pixels (space)
-        if np.ma.is_masked(data):
-            mask = data.mask.copy()
-            data = data.data
-        else:
-            mask = (data == fill_value) | (data < 0)
-        
-        # Convert to float and mark invalid as NaN
-        data = data.astype(np.float32)
-        data[mask] = np.nan
-        
-        # Resize using PIL for proper interpolation
-        if data.shape[0] != target_size:
-            img = Image.fromarray(data)
-            img = img.resize((target_size, target_size), Image.Resampling.LANCZOS)
-            data = np.array(img)
-        
-        return data
-    finally:
-        tmp_path.unlink()
+    if h5py is not None:
+        data = _read_cmi_h5py(body, target_size)
+    else:
+        data = _read_cmi_netcdf(body, target_size)
+    
+    if data.shape[0] != target_size:
+        data = _resize(data, target_size)
+    
+    return data
 
 
 def fetch_rgb_bands(
@@ -129,6 +387,7 @@ def fetch_rgb_bands(
     earth_size: int = 2048,
     satellite: str = DEFAULT_SATELLITE,
     verbose: bool = False,
+    cache_dir: Path | None = CACHE_DIR,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, datetime]:
     """
     Fetch and process RGB bands from a GOES satellite.
@@ -138,6 +397,7 @@ def fetch_rgb_bands(
         earth_size: Size to resize Earth to (pixels).
         satellite: Satellite identifier (e.g., 'goes-west', 'goes-east').
         verbose: Print progress messages.
+        cache_dir: Directory for cached NetCDF files. None = always download.
     
     Returns:
         Tuple of (red, veggie, blue) arrays and actual image timestamp.
@@ -167,11 +427,20 @@ def fetch_rgb_bands(
     if verbose:
         print(f"Image timestamp: {image_time.strftime('%Y-%m-%d %H:%M:%S UTC')}")
     
-    # Download bands
+    # Download bands in parallel (each band is an independent S3 object)
+    if verbose:
+        print(f"Downloading bands {', '.join(str(b) for b in sorted(files))}...")
+    
     bands_data = {}
-    for band_num, (bucket, key) in files.items():
-        if verbose:
-            print(f"Downloading band {band_num}...")
-        bands_data[band_num] = download_band(s3, bucket, key, earth_size)
+    with ThreadPoolExecutor(max_workers=len(files)) as executor:
+        futures = {
+            executor.submit(download_band, s3, bucket, key, earth_size, cache_dir): band_num
+            for band_num, (bucket, key) in files.items()
+        }
+        for future in as_completed(futures):
+            band_num = futures[future]
+            bands_data[band_num] = future.result()
+            if verbose:
+                print(f"Downloaded band {band_num}")
     
     return bands_data[2], bands_data[3], bands_data[1], image_time  # red, veggie, blue
@@ -1,10 +1,86 @@
 """Process GOES band data into true-color RGB imagery."""
 
+import functools
+import math
+from pathlib import Path
+
 import numpy as np
 from PIL import Image
 
+try:
+    from numba import njit, prange
+except ImportError:  # optional: pip install goes-imagery[fast]
+    njit = None
+
 from .config import DEFAULT_GAMMA, GREEN_COEFFICIENTS
 
+# Reflectance in [0, 1] is quantized to this many steps before the gamma lookup
+LUT_SIZE = 65536
+
+
+@functools.lru_cache(maxsize=8)
+def _gamma_lut(gamma: float) -> np.ndarray:
+    """
+    Build a lookup table mapping quantized reflectance to gamma-corrected uint8.
+    
+    Replaces a per-pixel power with a 64 KB table that stays cache-resident.
+    """
+    levels = np.arange(LUT_SIZE, dtype=np.float64) / (LUT_SIZE - 1)
+    return (np.power(levels, 1 / gamma) * 255).astype(np.uint8)
+
+
+if njit is not None:
+    # fastmath is left off: it lets LLVM assume no NaNs, which would break the
+    # space tests below
+    @njit(cache=True)
+    def _clip01(v):
+        """Clip a reflectance to the valid 0-1 range."""
+        return min(max(v, 0.0), 1.0)
+
+    @njit(cache=True)
+    def _gamma_quantize(v, lut):
+        """Clip a non-NaN reflectance to 0-1 and look up its gamma-corrected value."""
+        # Index in float32, as normalize_band's NumPy path does, so both agree
+        return lut[int(np.float32(_clip01(v)) * np.float32(lut.shape[0] - 1))]
+
+    @njit(parallel=True, cache=True)
+    def _normalize_kernel(data, lut, out):
+        """Fused clip + gamma + quantize, one pass per pixel."""
+        for i in prange(data.shape[0]):
+            for j in range(data.shape[1]):
+                v = data[i, j]
+                if math.isnan(v):
+                    out[i, j] = 0
+                else:
+                    out[i, j] = _gamma_quantize(v, lut)
+
+    @njit(parallel=True, cache=True)
+    def _true_color_kernel(red, veggie, blue, lut, r_coef, v_coef, b_coef, out):
+        """Normalize all three bands, synthesize green and write HWC RGB in one pass."""
+        for i in prange(out.shape[0]):
+            for j in range(out.shape[1]):
+                r = red[i, j]
+                v = veggie[i, j]
+                b = blue[i, j]
+                if math.isnan(r) or math.isnan(v) or math.isnan(b):
+                    out[i, j, 0] = 0
+                    out[i, j, 1] = 0
+                    out[i, j, 2] = 0
+                    continue
+                # Synthesize green from reflectance, before gamma and quantization.
+                # Mixed in float32 to match the NumPy fallback exactly
+                g = (
+                    np.float32(r_coef) * np.float32(_clip01(r))
+                    + np.float32(v_coef) * np.float32(_clip01(v))
+                    + np.float32(b_coef) * np.float32(_clip01(b))
+                )
+                out[i, j, 0] = _gamma_quantize(r, lut)
+                out[i, j, 1] = _gamma_quantize(g, lut)
+                out[i, j, 2] = _gamma_quantize(b, lut)
+else:
+    _normalize_kernel = None
+    _true_color_kernel = None
+
 
 def normalize_band(data: np.ndarray, gamma: float = DEFAULT_GAMMA) -> np.ndarray:
     """
@@ -18,16 +94,20 @@ def normalize_band(data: np.ndarray, gamma: float = DEFAULT_GAMMA) -> np.ndarray
     Returns:
         2D uint8 array (0-255).
     """
-    result = np.zeros(data.shape, dtype=np.float32)
-    valid = ~np.isnan(data)
+    lut = _gamma_lut(gamma)
     
-    # Clip to valid reflectance range
-    clipped = np.clip(data[valid], 0, 1)
+    if _normalize_kernel is not None:
+        out = np.empty(data.shape, dtype=np.uint8)
+        _normalize_kernel(data, lut, out)
+        return out
     
-    # Normalize and apply gamma correction
-    result[valid] = np.power(clipped, 1 / gamma)
+    # Quantize reflectance to a LUT index; NaN maps to index 0, which is black
+    scaled = np.asarray(data, dtype=np.float32) * (LUT_SIZE - 1)
+    np.nan_to_num(scaled, copy=False, nan=0.0)
+    np.clip(scaled, 0, LUT_SIZE - 1, out=scaled)
     
-    return (result * 255).astype(np.uint8)
+    # Apply gamma correction via table lookup
+    return lut[scaled.astype(np.uint16)]
 
 
 def create_true_color(
@@ -40,6 +120,7 @@ def create_true_color(
     Create true-color RGB image from GOES bands.
     
     Uses CIMSS formula for synthetic green channel since GOES lacks a true green band.
+    Green is computed from reflectance, then gamma-corrected with the other channels.
     
     Args:
         red: Band 2 data (red channel).
@@ -56,28 +137,36 @@ def create_true_color(
     veggie = veggie[:size, :size]
     blue = blue[:size, :size]
     
-    # Create combined space mask
-    space_mask = np.isnan(red) | np.isnan(veggie) | np.isnan(blue)
+    r_coef, v_coef, b_coef = GREEN_COEFFICIENTS
     
-    # Normalize bands
-    red_norm = normalize_band(red, gamma)
-    veggie_norm = normalize_band(veggie, gamma)
-    blue_norm = normalize_band(blue, gamma)
+    # Channels are written straight into one HWC buffer, so no np.stack copy
+    rgb = np.empty((size, size, 3), dtype=np.uint8)
     
-    # Compute synthetic green using CIMSS formula
-    r_coef, v_coef, b_coef = GREEN_COEFFICIENTS
-    green_norm = (
-        r_coef * red_norm.astype(np.float32)
-        + v_coef * veggie_norm.astype(np.float32)
-        + b_coef * blue_norm.astype(np.float32)
-    ).astype(np.uint8)
+    if _true_color_kernel is not None:
+        _true_color_kernel(red, veggie, blue, _gamma_lut(gamma), r_coef, v_coef, b_coef, rgb)
+        return rgb
+    
+    # Create combined space mask, OR-ing in place to avoid extra bool temporaries
+    space_mask = np.isnan(red)
+    space_mask |= np.isnan(veggie)
+    space_mask |= np.isnan(blue)
+    
+    # Compute synthetic green from reflectance using CIMSS formula
+    green = (
+        r_coef * np.clip(red, 0, 1)
+        + v_coef * np.clip(veggie, 0, 1)
+        + b_coef * np.clip(blue, 0, 1)
+    )
+    
+    # Normalize bands into their channel slices
+    rgb[..., 0] = normalize_band(red, gamma)
+    rgb[..., 1] = normalize_band(green, gamma)
+    rgb[..., 2] = normalize_band(blue, gamma)
     
     # Force space to black in all channels
-    red_norm[space_mask] = 0
-    green_norm[space_mask] = 0
-    blue_norm[space_mask] = 0
+    rgb[space_mask] = 0
     
-    return np.stack([red_norm, green_norm, blue_norm], axis=2)
+    return rgb
 
 
 def add_padding(rgb: np.ndarray, padding_ratio: float) -> np.ndarray:
@@ -125,8 +214,38 @@ def render_image(
         PIL Image object.
     """
     rgb = create_true_color(red, veggie, blue, gamma)
+    earth = Image.fromarray(rgb)
     
     if padding_ratio > 1.0:
-        rgb = add_padding(rgb, padding_ratio)
+        # Paste onto a black PIL canvas rather than building a padded array,
+        # which avoids a zero-filled numpy buffer plus a copy into it
+        h, w = rgb.shape[:2]
+        new_size = int(max(h, w) * padding_ratio)
+        canvas = Image.new("RGB", (new_size, new_size), (0, 0, 0))
+        canvas.paste(earth, ((new_size - w) // 2, (new_size - h) // 2))
+        return canvas
+    
+    return earth
+
+
+def save_image(image: Image.Image, path: Path) -> None:
+    """
+    Save a rendered image, choosing fast encoder settings from the file suffix.
     
-    return Image.fromarray(rgb)
+    PNG uses a low Deflate level, JPEG a high quality, and TIFF/BMP are written
+    uncompressed so pipeline outputs skip compression entirely.
+    
+    Args:
+        image: Rendered PIL image.
+        path: Output path; the suffix selects the format.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".png":
+        # Several times quicker to encode than the default, for ~10% larger files
+        image.save(path, compress_level=1)
+    elif suffix in (".jpg", ".jpeg"):
+        image.save(path, quality=95)
+    elif suffix in (".tif", ".tiff"):
+        image.save(path, compression=None)
+    else:
+        image.save(path)